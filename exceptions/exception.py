@@ -1,5 +1,33 @@
+import inspect
+import json
 import traceback
-from typing import Optional
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Frames of these may be suspended and resumed later; clearing one closes it
+_SUSPENDABLE_CODE_FLAGS = (
+    inspect.CO_GENERATOR | inspect.CO_COROUTINE | inspect.CO_ASYNC_GENERATOR
+)
+
+
+def _clear_frame_locals(tb) -> None:
+    """
+    Like traceback.clear_frames(), but leaves generator / coroutine frames
+    alone so wrapping an exception never closes a live generator.
+    """
+    while tb is not None:
+        frame = tb.tb_frame
+        if not frame.f_code.co_flags & _SUSPENDABLE_CODE_FLAGS:
+            try:
+                frame.clear()
+            except RuntimeError:
+                # Frame is still executing
+                pass
+        tb = tb.tb_next
 
 
 class CustomException(Exception):
@@ -11,7 +39,7 @@ class CustomException(Exception):
     - Original exception (if any)
     - File name
     - Line number
-    - Full traceback
+    - Full traceback (formatted lazily on first access)
     """
 
     def __init__(self, message: str, original_exception: Optional[Exception] = None):
@@ -19,32 +47,52 @@ class CustomException(Exception):
 
         self.message = message
         self.original_exception = original_exception
+        self._traceback_text: Optional[str] = None
 
         if original_exception:
             tb = original_exception.__traceback__
 
             if tb:
                 # Move to last traceback frame
-                while tb.tb_next:
-                    tb = tb.tb_next
+                nxt = tb.tb_next
+                while nxt is not None:
+                    tb = nxt
+                    nxt = tb.tb_next
 
                 self.file_name = tb.tb_frame.f_code.co_filename
                 self.line_number = tb.tb_lineno
+
+                # Drop frame locals so the stored exception does not pin them
+                _clear_frame_locals(original_exception.__traceback__)
             else:
                 self.file_name = "Unknown"
                 self.line_number = "Unknown"
+        else:
+            self.file_name = "Unknown"
+            self.line_number = "Unknown"
 
-            self.traceback = "".join(
+        # Built once; to_dict() / to_json() reuse it
+        self._dict: Dict[str, Any] = {
+            "message": self.message,
+            "file": self.file_name,
+            "line": self.line_number,
+            "original_error": repr(original_exception),
+        }
+
+    @property
+    def traceback(self) -> Optional[str]:
+        """
+        Formatted traceback of the original exception, built on first access.
+        """
+        if self._traceback_text is None and self.original_exception:
+            self._traceback_text = "".join(
                 traceback.format_exception(
-                    type(original_exception),
-                    original_exception,
-                    original_exception.__traceback__,
+                    type(self.original_exception),
+                    self.original_exception,
+                    self.original_exception.__traceback__,
                 )
             )
-        else:
-            self.file_name = "Unknown"
-            self.line_number = "Unknown"
-            self.traceback = None
+        return self._traceback_text
 
     def __str__(self) -> str:
         base_message = (
@@ -60,13 +108,20 @@ class CustomException(Exception):
 
         return base_message
 
-    def to_dict(self):
+    def to_dict(self) -> Dict[str, Any]:
         """
         Structured format for API responses / monitoring.
         """
-        return {
-            "message": self.message,
-            "file": self.file_name,
-            "line": self.line_number,
-            "original_error": repr(self.original_exception),
-        }
+        return self._dict.copy()
+
+    def to_json(self) -> bytes:
+        """
+        to_dict() serialized as UTF-8 JSON bytes.
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(self._dict, default=str)
+            except TypeError:
+                # orjson rejects lone surrogates; stdlib json escapes them
+                pass
+        return json.dumps(self._dict, default=str).encode("utf-8")
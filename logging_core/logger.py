@@ -1,24 +1,129 @@
+import atexit
+import functools
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from typing import Optional, Dict, Union
+import queue
+import threading
+import time
+import warnings
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional, Dict, Tuple, Union
+
 import json
 
+try:
+    import orjson
+
+    def _json_bytes(value) -> bytes:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # orjson rejects lone surrogates (e.g. surrogateescape filenames)
+            return json.dumps(value).encode("utf-8")
+
+except ImportError:  # pragma: no cover - optional speedup
+
+    def _json_bytes(value) -> bytes:
+        return json.dumps(value).encode("utf-8")
+
+
+# Only the values change per record; they are spliced in pre-encoded
+_JSON_TEMPLATE = b'{"time":"%s","level":%s,"module":%s,"message":%s}'
+
+# JSON-encoded level / logger names, which repeat on every record
+_ENCODED_NAMES: Dict[str, bytes] = {}
+
+
+def _encoded_name(name: str) -> bytes:
+    encoded = _ENCODED_NAMES.get(name)
+    if encoded is None:
+        encoded = _ENCODED_NAMES[name] = _json_bytes(name)
+    return encoded
+
 
 class JsonFormatter(logging.Formatter):
     """
     JSON formatter for structured logging.
     Useful for cloud / monitoring systems.
+
+    Uses orjson when it is installed, falling back to stdlib json.
     """
 
+    _instance: Optional["JsonFormatter"] = None
+
+    @classmethod
+    def get(cls) -> "JsonFormatter":
+        """
+        Shared formatter instance, created on first use.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, "")
+
+    def _format_time(self, record) -> str:
+        """
+        ISO-8601 local timestamp with milliseconds.
+        The strftime part is cached per second so bursts reuse it.
+        """
+        second = int(record.created)
+        cached_second, prefix = self._time_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+            self._time_cache = (second, prefix)
+        return "%s.%03d" % (prefix, record.msecs)
+
     def format(self, record):
-        log_record = {
-            "time": self.formatTime(record),
-            "level": record.levelname,
-            "module": record.name,
-            "message": record.getMessage(),
-        }
-        return json.dumps(log_record)
+        return (
+            _JSON_TEMPLATE
+            % (
+                self._format_time(record).encode("ascii"),
+                _encoded_name(record.levelname),
+                _encoded_name(record.name),
+                _json_bytes(record.getMessage()),
+            )
+        ).decode("utf-8")
+
+
+_TEXT_FORMATTER = logging.Formatter(
+    "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+)
+
+
+class _FileQueueHandler(QueueHandler):
+    """
+    Enqueues records for the background listener, tagged with the
+    file handler that should write them.
+    """
+
+    def __init__(self, log_queue: "queue.SimpleQueue", target: logging.Handler):
+        super().__init__(log_queue)
+        self.target = target
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.target_handler = self.target
+        return record
+
+    def emit(self, record):
+        # Write inline whenever no listener runs in this process: after it
+        # was stopped at exit, or in a forked child, which never gets one.
+        if os.getpid() != LoggerFactory._listener_pid:
+            self.target.handle(record)
+            return
+        super().emit(record)
+
+
+class _DispatchHandler(logging.Handler):
+    """
+    Runs on the listener thread and hands each record to its target handler.
+    """
+
+    def handle(self, record):
+        return record.target_handler.handle(record)
 
 
 class LoggerFactory:
@@ -30,12 +135,115 @@ class LoggerFactory:
     - Optional console handler
     - Environment-based log level
     - Duplicate handler protection
+    - Shared file / console handlers
+    - File writes on a background thread (QueueListener)
     - Safe caching
     - UTF-8 encoding
     - Optional JSON logging
     """
 
     _configured_loggers: Dict[str, logging.Logger] = {}
+    # Handlers are shared so one file is written through one handler.
+    # The first logger to create a handler decides its format and rotation.
+    _file_handlers: Dict[Tuple[str, str], _FileQueueHandler] = {}
+    _console_handlers: Dict[bool, logging.StreamHandler] = {}
+
+    # One queue + listener thread per process performs all file writes.
+    # _listener_pid is set only while the listener runs in that process.
+    _log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+    _queue_listener: Optional[QueueListener] = None
+    _listener_pid: Optional[int] = None
+    _listener_paused_for_fork = False
+    _listener_lock = threading.Lock()
+
+    @staticmethod
+    def _ensure_listener() -> None:
+        """
+        Start the background listener once; it is stopped (and drained) at exit
+        and paused around fork() so no file write is in flight.
+        """
+        if LoggerFactory._queue_listener is not None:
+            return
+        with LoggerFactory._listener_lock:
+            if LoggerFactory._queue_listener is None:
+                listener = QueueListener(LoggerFactory._log_queue, _DispatchHandler())
+                listener.start()
+                LoggerFactory._listener_pid = os.getpid()
+                LoggerFactory._queue_listener = listener
+                atexit.register(LoggerFactory._stop_listener)
+                if hasattr(os, "register_at_fork"):
+                    os.register_at_fork(
+                        before=LoggerFactory._pause_listener,
+                        after_in_parent=LoggerFactory._resume_listener,
+                    )
+
+    @staticmethod
+    def _stop_listener_locked() -> bool:
+        """
+        Stop the listener and write out anything still queued. Later records
+        from this process are written inline by _FileQueueHandler.
+        Returns False when no listener was running in this process.
+        """
+        listener = LoggerFactory._queue_listener
+        if listener is None or os.getpid() != LoggerFactory._listener_pid:
+            return False
+        LoggerFactory._listener_pid = None
+        listener.stop()
+
+        # Records enqueued after the stop sentinel
+        while True:
+            try:
+                record = LoggerFactory._log_queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is not None:
+                record.target_handler.handle(record)
+        return True
+
+    @staticmethod
+    def _stop_listener() -> None:
+        """
+        Stop the listener for good (registered with atexit).
+        """
+        with LoggerFactory._listener_lock:
+            LoggerFactory._listener_paused_for_fork = False
+            LoggerFactory._stop_listener_locked()
+
+    @staticmethod
+    def _pause_listener() -> None:
+        """
+        Before fork(): stop the listener so the child does not inherit a
+        file handler locked mid-write by a thread that does not exist there.
+        """
+        with LoggerFactory._listener_lock:
+            LoggerFactory._listener_paused_for_fork = LoggerFactory._stop_listener_locked()
+
+    @staticmethod
+    def _resume_listener() -> None:
+        """
+        After fork(), in the parent: restart the listener if it was paused.
+        """
+        with LoggerFactory._listener_lock:
+            if LoggerFactory._listener_paused_for_fork:
+                LoggerFactory._listener_paused_for_fork = False
+                LoggerFactory._queue_listener.start()
+                LoggerFactory._listener_pid = os.getpid()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _resolve_default_level() -> int:
+        """
+        Level from the LOG_LEVEL env var, read once and cached.
+        """
+        level_name = os.getenv("LOG_LEVEL", "INFO")
+        return getattr(logging, level_name.upper(), logging.INFO)
+
+    @classmethod
+    def reset_level_cache(cls) -> None:
+        """
+        Forget the cached LOG_LEVEL so the next lookup re-reads the env var.
+        """
+        cls._resolve_default_level.cache_clear()
 
     @staticmethod
     def get_logger(
@@ -49,19 +257,22 @@ class LoggerFactory:
         json_format: bool = False,
     ) -> logging.Logger:
 
+        # Fast path: cached logger and no level override
+        cached = _configured_loggers.get(name)
+        if cached is not None and level is None:
+            return cached
+
         # Resolve logging level
         if level is None:
-            level_name = os.getenv("LOG_LEVEL", "INFO")
-            level = getattr(logging, level_name.upper(), logging.INFO)
+            level = LoggerFactory._resolve_default_level()
 
         if isinstance(level, str):
             level = getattr(logging, level.upper(), logging.INFO)
 
-        # Return cached logger if exists
-        if name in LoggerFactory._configured_loggers:
-            logger = LoggerFactory._configured_loggers[name]
-            logger.setLevel(level)
-            return logger
+        # Return cached logger with the requested level
+        if cached is not None:
+            cached.setLevel(level)
+            return cached
 
         os.makedirs(log_dir, exist_ok=True)
 
@@ -78,28 +289,54 @@ class LoggerFactory:
             file_path = os.path.join(log_dir, log_file)
 
             # Choose formatter
-            if json_format:
-                formatter = JsonFormatter()
+            formatter = JsonFormatter.get() if json_format else _TEXT_FORMATTER
+
+            # File handler, shared by every logger writing to the same file.
+            # The logger only enqueues; the listener thread does the write.
+            file_key = (os.path.abspath(log_dir), log_file)
+            queue_handler = LoggerFactory._file_handlers.get(file_key)
+            if queue_handler is not None:
+                shared = queue_handler.target
+                if shared.formatter is not formatter:
+                    shared_format = "JSON" if shared.formatter is JsonFormatter.get() else "text"
+                    warnings.warn(
+                        f"Logger '{name}' shares {file_path} with an existing handler "
+                        f"that writes {shared_format}; requested "
+                        f"json_format={json_format} is ignored for this file",
+                        stacklevel=2,
+                    )
+                if (shared.maxBytes, shared.backupCount) != (max_bytes, backup_count):
+                    warnings.warn(
+                        f"Logger '{name}' shares {file_path} with an existing handler "
+                        f"(max_bytes={shared.maxBytes}, backup_count={shared.backupCount}); "
+                        f"requested max_bytes={max_bytes}, backup_count={backup_count} "
+                        "are ignored",
+                        stacklevel=2,
+                    )
             else:
-                formatter = logging.Formatter(
-                    "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+                file_handler = RotatingFileHandler(
+                    file_path,
+                    maxBytes=max_bytes,
+                    backupCount=backup_count,
+                    encoding="utf-8",
                 )
+                file_handler.setFormatter(formatter)
+                queue_handler = _FileQueueHandler(LoggerFactory._log_queue, file_handler)
+                LoggerFactory._file_handlers[file_key] = queue_handler
+                LoggerFactory._ensure_listener()
+            logger.addHandler(queue_handler)
 
-            # File handler
-            file_handler = RotatingFileHandler(
-                file_path,
-                maxBytes=max_bytes,
-                backupCount=backup_count,
-                encoding="utf-8",
-            )
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-
-            # Console handler
+            # Console handler, shared per output format
             if console:
-                console_handler = logging.StreamHandler()
-                console_handler.setFormatter(formatter)
+                console_handler = LoggerFactory._console_handlers.get(json_format)
+                if console_handler is None:
+                    console_handler = logging.StreamHandler()
+                    console_handler.setFormatter(formatter)
+                    LoggerFactory._console_handlers[json_format] = console_handler
                 logger.addHandler(console_handler)
 
-        LoggerFactory._configured_loggers[name] = logger
+        _configured_loggers[name] = logger
         return logger
+
+
+_configured_loggers = LoggerFactory._configured_loggers
@@ -1,34 +1,51 @@
+import ast
+import io
+import logging
+import os
 import numpy as np
 import yaml
 from pathlib import Path
-import dill
 
 
 from exceptions import CustomException
 from logging_core import LoggerFactory
 from typing import Union, List
 import pickle
+import json
+
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 
 logger = LoggerFactory.get_logger(__name__,level="DEBUG")
 
+# Large buffer for object files to cut write/read syscalls
+_OBJECT_IO_BUFFER_SIZE = 1024 * 1024
 
-def read_yaml(file_path: str) -> dict:
-    try:
-        path = Path(file_path)
+# Sidecar holding shape/dtype for raw arrays saved with fast=True
+_NUMPY_META_SUFFIX = ".meta"
 
-        if not path.exists():
-            raise FileNotFoundError(f"YAML file not found at {file_path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            content = yaml.safe_load(f)
+def read_yaml(file_path: str) -> dict:
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = yaml.load(f, Loader=_YamlLoader)
 
         if content is None:
             raise ValueError("YAML file is empty")
 
-        logger.info(f"YAML file loaded successfully: {file_path}")
+        logger.info("YAML file loaded successfully: %s", file_path)
 
         return content
 
+    except FileNotFoundError as e:
+        logger.error("YAML file not found at %s", file_path)
+        raise CustomException(
+            message=f"YAML file not found at {file_path}",
+            original_exception=e
+        )
+
     except Exception as e:
         logger.error("Failed to read YAML file", exc_info=True)
         raise CustomException(
@@ -57,16 +74,21 @@ def write_yaml(file_path: str, data: dict, create_dir: bool = True) -> None:
         if create_dir:
             path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(
-                data,
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-            )
+        # Serialize in memory, then write the file in one call
+        buffer = io.StringIO()
+        yaml.dump(
+            data,
+            buffer,
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
+
+        with open(path, "wb") as f:
+            f.write(buffer.getvalue().encode("utf-8"))
 
-        logger.info(f"YAML file written successfully at: {file_path}")
+        logger.info("YAML file written successfully at: %s", file_path)
 
     except Exception as e:
         logger.error("Failed to write YAML file", exc_info=True)
@@ -77,29 +99,38 @@ def write_yaml(file_path: str, data: dict, create_dir: bool = True) -> None:
 
 def load_object(file_path: str) -> object:
     try:
-        path = Path(file_path)
-
-        if not path.exists():
-            raise FileNotFoundError(f"Object file not found at {file_path}")
+        with open(file_path, "rb", buffering=_OBJECT_IO_BUFFER_SIZE) as f:
+            # Protocol 2+ pickles (and dill output) start with PROTO opcode
+            is_binary_pickle = f.read(1) == b"\x80"
+            f.seek(0)
 
-        # Trying pickle first
-        try:
-            with open(path, "rb") as f:
+            # Trying pickle first
+            try:
                 obj = pickle.load(f)
-            logger.info("Object loaded using pickle")
-            return obj
-
+                logger.info("Object loaded using pickle")
+                return obj
 
-        except Exception as pickle_error:
-            logger.warning(f"Pickle load failed: {pickle_error}")
-            logger.warning("Pickle load failed, trying dill")
+            except (pickle.UnpicklingError, AttributeError, ImportError) as pickle_error:
+                # Only a binary pickle can be something dill would read
+                if not is_binary_pickle:
+                    raise
+                logger.warning("Pickle load failed: %s", pickle_error)
+                logger.warning("Pickle load failed, trying dill")
+                f.seek(0)
 
-            with open(path, "rb") as f:
-                obj = dill.load(f)
+            import dill  # imported lazily, only needed as a fallback
 
+            obj = dill.load(f)
             logger.info("Object loaded using dill")
             return obj
 
+    except FileNotFoundError as e:
+        logger.error("Object file not found at %s", file_path)
+        raise CustomException(
+            message=f"Object file not found at {file_path}",
+            original_exception=e
+        )
+
     except Exception as e:
         logger.error("Failed to load object", exc_info=True)
         raise CustomException(
@@ -118,15 +149,17 @@ def save_object(file_path: str, obj: object, create_dir: bool = True) -> None:
 
         # Try pickle first (faster)
         try:
-            with open(path, "wb") as f:
-                pickle.dump(obj, f)
+            with open(path, "wb", buffering=_OBJECT_IO_BUFFER_SIZE) as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
             logger.info("Object saved using pickle")
 
         except Exception:
             logger.warning("Pickle failed, falling back to dill")
 
-            with open(path, "wb") as f:
-                dill.dump(obj, f)
+            import dill  # imported lazily, only needed as a fallback
+
+            with open(path, "wb", buffering=_OBJECT_IO_BUFFER_SIZE) as f:
+                dill.dump(obj, f, protocol=dill.HIGHEST_PROTOCOL)
 
             logger.info("Object saved using dill")
 
@@ -137,7 +170,19 @@ def save_object(file_path: str, obj: object, create_dir: bool = True) -> None:
             original_exception=e
         )
 
-def save_numpy_array_data(file_path: str, array: np.ndarray, create_dir: bool = True) -> None:
+def _numpy_meta_path(file_path: str) -> str:
+    """
+    Sidecar path for a raw array file: full file name plus .meta suffix.
+    """
+    return os.fspath(file_path) + _NUMPY_META_SUFFIX
+
+
+def save_numpy_array_data(
+    file_path: str,
+    array: np.ndarray,
+    create_dir: bool = True,
+    fast: bool = False,
+) -> None:
     """
     Saves a NumPy array to a .npy file.
 
@@ -149,6 +194,9 @@ def save_numpy_array_data(file_path: str, array: np.ndarray, create_dir: bool =
         Numpy array to save
     create_dir : bool
         Whether to create parent directories automatically
+    fast : bool
+        Write raw bytes with a .meta sidecar (shape/dtype) instead of the
+        .npy format. Not supported for object arrays.
     """
     try:
         path = Path(file_path)
@@ -159,9 +207,32 @@ def save_numpy_array_data(file_path: str, array: np.ndarray, create_dir: bool =
         if not isinstance(array, np.ndarray):
             raise TypeError("Input must be a numpy.ndarray")
 
-        np.save(path, array)
-
-        logger.info(f"Numpy array saved successfully at: {file_path}")
+        if fast:
+            if array.dtype.hasobject:
+                raise TypeError("fast=True does not support object arrays")
+
+            np.ascontiguousarray(array).tofile(path)
+            # descr keeps the field layout of structured dtypes
+            meta = {
+                "shape": list(array.shape),
+                "descr": repr(np.lib.format.dtype_to_descr(array.dtype)),
+            }
+            with open(_numpy_meta_path(file_path), "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        else:
+            np.save(path, array)
+
+            # np.save appends .npy when missing; drop a stale sidecar for the
+            # written file so the loader does not misread it as raw bytes
+            saved_path = os.fspath(file_path)
+            if not saved_path.endswith(".npy"):
+                saved_path += ".npy"
+            try:
+                os.remove(_numpy_meta_path(saved_path))
+            except FileNotFoundError:
+                pass
+
+        logger.info("Numpy array saved successfully at: %s", file_path)
 
     except Exception as e:
         logger.error("Failed to save numpy array", exc_info=True)
@@ -170,22 +241,48 @@ def save_numpy_array_data(file_path: str, array: np.ndarray, create_dir: bool =
             original_exception=e
         )
 
-def load_numpy_array_data(file_path: str) -> np.ndarray:
+def load_numpy_array_data(file_path: str, mmap: bool = False) -> np.ndarray:
     """
-    Loads a NumPy array from a .npy file.
+    Loads a NumPy array from a .npy file, or from raw bytes when a .meta
+    sidecar written by ``save_numpy_array_data(..., fast=True)`` exists.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the saved array
+    mmap : bool
+        Memory-map the file (copy-on-write) instead of reading it into RAM.
+        The returned array stays backed by the file: do not overwrite or
+        delete the file while the array is in use.
     """
     try:
-        path = Path(file_path)
-
-        if not path.exists():
-            raise FileNotFoundError(f"Numpy file not found at {file_path}")
-
-        array = np.load(path)
-
-        logger.info(f"Numpy array loaded successfully from: {file_path}")
+        try:
+            with open(_numpy_meta_path(file_path), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            meta = None
+
+        if meta is not None:
+            dtype = np.lib.format.descr_to_dtype(ast.literal_eval(meta["descr"]))
+            shape = tuple(meta["shape"])
+            if mmap and dtype.itemsize * int(np.prod(shape)) > 0:
+                array = np.memmap(file_path, dtype=dtype, mode="c", shape=shape)
+            else:
+                array = np.fromfile(file_path, dtype=dtype).reshape(shape)
+        else:
+            array = np.load(file_path, mmap_mode="c" if mmap else None)
+
+        logger.info("Numpy array loaded successfully from: %s", file_path)
 
         return array
 
+    except FileNotFoundError as e:
+        logger.error("Numpy file not found at %s", file_path)
+        raise CustomException(
+            message=f"Numpy file not found at {file_path}",
+            original_exception=e
+        )
+
     except Exception as e:
         logger.error("Failed to load numpy array", exc_info=True)
         raise CustomException(
@@ -210,12 +307,23 @@ def create_directories(
     """
     try:
         # Convert single string to list
-        if isinstance(paths, str):
+        if isinstance(paths, (str, os.PathLike)):
             paths = [paths]
 
-        for path in paths:
-            Path(path).mkdir(parents=True, exist_ok=exist_ok)
-            logger.info(f"Directory created or already exists: {path}")
+        # Deduplicate, then create shallow paths first
+        unique_paths = sorted(
+            {os.path.normpath(os.fspath(path)) for path in paths},
+            key=lambda path: path.count(os.sep),
+        )
+
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        for path in unique_paths:
+            os.makedirs(path, exist_ok=exist_ok)
+            if debug_enabled:
+                logger.debug("Directory created or already exists: %s", path)
+
+        logger.info("Created or verified %d directories", len(unique_paths))
 
     except Exception as e:
         logger.error("Failed to create directories", exc_info=True)